@@ -30,13 +30,6 @@ def force_bitcast_convert_type(val, new_type):
     return lax.bitcast_convert_type(val, new_type)
 
 
-def _fill_forward(
-    last_observed_yi: Shaped[Array, " *channels"], yi: Shaped[Array, " *channels"]
-) -> tuple[Shaped[Array, " *channels"], Shaped[Array, " *channels"]]:
-    yi = jnp.where(jnp.isnan(yi), last_observed_yi, yi)
-    return yi, yi
-
-
 @jax.jit
 def fill_forward(
     ys: Shaped[Array, " times *channels"],
@@ -64,12 +57,20 @@ def fill_forward(
     The fill-forwarded data.
     """
 
-    if replace_nans_at_start is None:
-        y0 = ys[0]
-    else:
-        y0 = jnp.broadcast_to(replace_nans_at_start, ys[0].shape)
-    _, ys = lax.scan(_fill_forward, y0, ys)
-    return ys
+    # Rather than scanning over "times" (which is inherently sequential), we find the
+    # index of the most recent non-NaN observation via a cumulative max, which XLA
+    # lowers to a parallel associative scan. We then gather from those indices.
+    observed = jnp.invert(jnp.isnan(ys))
+    indices = left_broadcast_to(jnp.arange(ys.shape[0]), ys.shape)
+    indices = lax.select(observed, indices, jnp.full_like(indices, -1))
+    indices = lax.cummax(indices, axis=0)
+    # Entries prior to any observation gather from `ys[0]`, which is necessarily NaN
+    # for them. So these are already left alone without any extra work.
+    filled = jnp.take_along_axis(ys, jnp.maximum(indices, 0), axis=0)
+    if replace_nans_at_start is not None:
+        start = jnp.broadcast_to(replace_nans_at_start, ys.shape).astype(ys.dtype)
+        filled = lax.select(indices < 0, start, filled)
+    return filled
 
 
 def linear_rescale(t0, t, t1) -> Array:
@@ -9,3 +9,17 @@ def test_fill_forward():
     out_ = jnp.array([jnp.nan, 0.0, 1.0, 1.0, 1.0, 2.0, 2.0])
     fill_in = diffrax._misc.fill_forward(in_[:, None])
     assert tree_allclose(fill_in, out_[:, None], equal_nan=True)
+    fill_in = diffrax._misc.fill_forward(in_)
+    assert tree_allclose(fill_in, out_, equal_nan=True)
+
+
+def test_fill_forward_channels():
+    nan = jnp.nan
+    in_ = jnp.array([[nan, 1.0], [0.0, nan], [nan, nan], [2.0, 3.0], [nan, nan]])
+    out_ = jnp.array([[nan, 1.0], [0.0, 1.0], [0.0, 1.0], [2.0, 3.0], [2.0, 3.0]])
+    fill_in = diffrax._misc.fill_forward(in_)
+    assert tree_allclose(fill_in, out_, equal_nan=True)
+
+    out_ = out_.at[0, 0].set(-1.0)
+    fill_in = diffrax._misc.fill_forward(in_, jnp.array([-1.0, -2.0]))
+    assert tree_allclose(fill_in, out_)